@@ -1,7 +1,7 @@
 import binascii
 import os
 
-from typing import Optional
+from typing import Iterable, Optional
 from datetime import timedelta
 
 from django.db import models
@@ -80,6 +80,8 @@ class AbstractCodeVerify(models.Model):
     created = models.DateTimeField(_('date created'), auto_now_add=True)
 
     email: Email | None = None
+    # Fields required to check the code validity
+    check_fields: tuple[str, ...] = ('code', 'created')
     expire_time: timedelta | None = timedelta(
         seconds=settings.USER_CODE_VERIFY_EXPIRE_TIME,
     )
@@ -97,7 +99,12 @@ class AbstractCodeVerify(models.Model):
         return binascii.hexlify(os.urandom(20)).decode()
 
     @classmethod
-    def check_is_valid(cls, code: str, select_related_user: bool = False):
+    def check_is_valid(
+        cls,
+        code: str,
+        select_related_user: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ):
         if not isinstance(code, str) or not code:
             raise ValueError(
                 _('The `code` attribute must be a non-empty string.'),
@@ -109,6 +116,10 @@ class AbstractCodeVerify(models.Model):
         if select_related_user:
             queryset = queryset.select_related('user')
 
+        # Load only the given fields, the others are deferred
+        if fields is not None:
+            queryset = queryset.only(*fields)
+
         instance = queryset.first()
 
         if instance is None:
@@ -31,3 +31,17 @@ except ImportError:
 
     extend_schema = create_empty_decorator
     extend_schema_view = create_empty_decorator
+
+
+try:
+    from celery import shared_task
+except ImportError:
+    def shared_task(*args, **kwargs):
+        """Return decorator that runs the task synchronously on `delay()`."""
+        def decorator(f):
+            f.delay = f
+            return f
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return decorator(args[0])
+        return decorator
@@ -1,8 +1,19 @@
+from django.apps import apps
 from django.contrib.auth.models import UserManager as BaseUserManager
 from django.contrib.auth.hashers import make_password
 
 
 class UserManager(BaseUserManager):
+    def get_by_natural_key(self, username):
+        queryset = self.get_queryset()
+
+        # Join the authentication token, so `Login` view can access the
+        # `user.auth_token` without an additional query
+        if apps.is_installed('rest_framework.authtoken'):
+            queryset = queryset.select_related('auth_token')
+
+        return queryset.get(**{self.model.USERNAME_FIELD: username})
+
     def _create_user(
         self,
         email: str,
@@ -0,0 +1,26 @@
+from django.utils.translation import gettext_lazy as _
+
+
+ERR_PASSWORD_MISMATCH = _(
+    'The given `password` field does not match with the user password.',
+)
+ERR_EMAIL_TAKEN = _('Email address already taken.')
+ERR_PASSWORD_RESET_NOT_ALLOWED = _('Password reset not allowed.')
+ERR_LOGIN_INVALID = _('Unable to login with provided credentials.')
+ERR_NOT_VERIFIED = _('User account not verified.')
+ERR_NOT_ACTIVE = _('User account not active.')
+
+SUCCESS_CODE_VALID = _(
+    'The given `code` parameter is valid, can proceed to %s.'
+)
+SUCCESS_PASSWORD_RESET_SENT = _(
+    'The email with the password reset code will be sent soon.',
+)
+SUCCESS_EMAIL_CHANGE_SENT = _(
+    'The email with the email change code will be sent soon.',
+)
+SUCCESS_PASSWORD_CHANGED = _('Password has been changed.')
+SUCCESS_LOGGED_OUT = _('User logged out.')
+SUCCESS_SIGNUP_VERIFIED = _('User email address has been verified.')
+SUCCESS_PASSWORD_RESET = _('User password has been reset.')
+SUCCESS_EMAIL_CHANGED = _('Email address has been changed.')
@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, Optional
 
-from django.db import models
+from django.db import connections, models, router
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings as django_settings
 
@@ -32,9 +33,67 @@ class PasswordResetCode(AbstractCodeVerify):
         verbose_name_plural = _('password reset codes')
         abstract = ABSTRACT
 
+    @classmethod
+    def create_for_verified_email(
+        cls,
+        email: str,
+        ipaddr: str,
+        link: str = '',
+    ) -> Optional[str]:
+        """Create password reset code for the verified and active user.
+
+        Finds the user by email and inserts the code with a single
+        `INSERT ... SELECT` query. Returns the created code or `None` if
+        there is no verified and active user with the given email.
+
+        Note:
+            The raw query bypasses the `save()` method and the `pre_save`
+            and `post_save` signals, use `objects.create()` if the code
+            creation must trigger them.
+        """
+        connection = connections[router.db_for_write(cls)]
+        qn = connection.ops.quote_name
+        opts = cls._meta
+        user_opts = opts.get_field('user').related_model._meta
+
+        def column(options, name):
+            return qn(options.get_field(name).column)
+
+        code = cls.generate_code()
+        sql = (
+            'INSERT INTO %s (%s, %s, %s, %s, %s) '
+            'SELECT %%s, %s, %%s, %%s, %%s FROM %s '
+            'WHERE %s = %%s AND %s = %%s AND %s = %%s'
+        ) % (
+            qn(opts.db_table),
+            column(opts, 'code'),
+            column(opts, 'user'),
+            column(opts, 'ipaddr'),
+            column(opts, 'link'),
+            column(opts, 'created'),
+            qn(user_opts.pk.column),
+            qn(user_opts.db_table),
+            column(user_opts, 'email'),
+            column(user_opts, 'is_verified'),
+            column(user_opts, 'is_active'),
+        )
+        params = [
+            code,
+            connection.ops.adapt_ipaddressfield_value(ipaddr),
+            link,
+            connection.ops.adapt_datetimefield_value(timezone.now()),
+            email,
+            True,
+            True,
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return code if cursor.rowcount else None
+
     def change_user_password(self, password: str):
         self.user.set_password(password)
-        self.user.save()
+        self.user.save(update_fields=['password'])
 
 
 class EmailChangeCode(AbstractCodeVerify):
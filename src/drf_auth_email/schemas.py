@@ -1,5 +1,18 @@
 from .compat import OpenApiParameter, OpenApiExample, OpenApiResponse
-from .serializers import DetailErrorSerializer
+from .messages import \
+    SUCCESS_EMAIL_CHANGE_SENT, \
+    SUCCESS_EMAIL_CHANGED, \
+    SUCCESS_LOGGED_OUT, \
+    SUCCESS_PASSWORD_CHANGED, \
+    SUCCESS_PASSWORD_RESET, \
+    SUCCESS_PASSWORD_RESET_SENT, \
+    SUCCESS_SIGNUP_VERIFIED
+from .serializers import \
+    DetailErrorSerializer, \
+    SuccessMessageSerializer, \
+    SuccessMessageWithEmailSerializer, \
+    TokenSerializer, \
+    UserSerializer
 
 
 CodeQueryParameter = OpenApiParameter(
@@ -56,3 +69,142 @@ ErrorCodeResponse = OpenApiResponse(
     ],
 )
 """TODO: add docs."""
+
+
+CodeValidResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    description='Action code is valid',
+    examples=[
+        OpenApiExample(
+            'Code parameter is valid',
+            description='code parameter is valid',
+            value={
+                'success': 'The given `code` parameter is valid.',
+            },
+        ),
+    ],
+)
+"""Successful response of the action code verification views."""
+
+
+SignupResponse = OpenApiResponse(
+    response=UserSerializer,
+    description='New unverified user',
+)
+"""Successful response of the signup request with the created user."""
+
+
+SignupErrorResponse = OpenApiResponse(
+    response=DetailErrorSerializer,
+    description='The request body is invalid',
+)
+"""Error response of the signup request with an invalid body."""
+
+
+PasswordResetCreatedResponse = OpenApiResponse(
+    response=SuccessMessageWithEmailSerializer,
+    description='The password reset request has been created',
+    examples=[
+        OpenApiExample(
+            'Success password reset request creation',
+            value={
+                'success': SUCCESS_PASSWORD_RESET_SENT,
+                'email': 'example@email.com',
+            },
+            description=(
+                'A password reset message has been sent to '
+                '`example@email.com`. The user can continue '
+                'the action by clicking the sent link.'
+            ),
+        ),
+    ],
+)
+"""Successful response of the password reset request creation."""
+
+
+EmailChangeCreatedResponse = OpenApiResponse(
+    response=SuccessMessageWithEmailSerializer,
+    description='The email change request has been created',
+    examples=[
+        OpenApiExample(
+            'Success email change request creation',
+            value={
+                'success': SUCCESS_EMAIL_CHANGE_SENT,
+                'email': 'example@email.com',
+            },
+            description=(
+                'A email change message has been sent to '
+                '`example@email.com`. The user can continue '
+                'the action by clicking the sent link.'
+            ),
+        ),
+    ],
+)
+"""Successful response of the email change request creation."""
+
+
+SignupVerifiedResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    examples=[
+        OpenApiExample(
+            'Signup completed successfully',
+            value={'success': SUCCESS_SIGNUP_VERIFIED},
+        ),
+    ],
+)
+"""Successful response of the signup verification."""
+
+
+PasswordResetVerifiedResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    examples=[
+        OpenApiExample(
+            'Password reset completed successfully',
+            value={'success': SUCCESS_PASSWORD_RESET},
+        ),
+    ],
+)
+"""Successful response of the password reset verification."""
+
+
+EmailChangeVerifiedResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    examples=[
+        OpenApiExample(
+            'Email change completed successfully',
+            value={'success': SUCCESS_EMAIL_CHANGED},
+        ),
+    ],
+)
+"""Successful response of the email change verification."""
+
+
+PasswordChangedResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    examples=[
+        OpenApiExample(
+            'Password change completed successfully',
+            value={'success': SUCCESS_PASSWORD_CHANGED},
+        ),
+    ],
+)
+"""Successful response of the password change."""
+
+
+TokenResponse = OpenApiResponse(
+    response=TokenSerializer,
+    description='User authentication token',
+)
+"""Successful login response with the user authentication token."""
+
+
+LoggedOutResponse = OpenApiResponse(
+    response=SuccessMessageSerializer,
+    examples=[
+        OpenApiExample(
+            'Message about user logging out',
+            value={'success': SUCCESS_LOGGED_OUT},
+        ),
+    ],
+)
+"""Successful response of the user logout."""
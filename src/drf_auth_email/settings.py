@@ -15,9 +15,20 @@ DEFAULTS = {
 
     'USER_EMAILS_DEFAULT_ORIGIN': 'http://127.0.0.1:8000',
     'USER_EMAIL_URL_BASENAME': 'drf-auth-email',
+    # Send emails through the `drf_auth_email.tasks` Celery tasks
+    'USER_EMAILS_USE_CELERY': False,
+    'USER_EMAILS_TASK_QUEUE': 'emails',
 
     # In seconds
-    'USER_CODE_VERIFY_EXPIRE_TIME': 259200
+    'USER_CODE_VERIFY_EXPIRE_TIME': 259200,
+
+    # Used by `drf_auth_email.throttling.ScopedRateThrottle`
+    'USER_THROTTLE_RATES': {
+        'signup': '10/hour',
+        'password_reset': '10/hour',
+        'email_change': '10/hour',
+        'login': '30/hour',
+    },
 }
 
 
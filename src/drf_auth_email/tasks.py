@@ -0,0 +1,69 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from .compat import shared_task
+from .settings import settings
+
+
+@shared_task(queue=settings.USER_EMAILS_TASK_QUEUE, ignore_result=True)
+def send_action_code_email(model_label: str, pk: str) -> None:
+    """Send email of the action code instance with the given primary key."""
+    action_code = (
+        apps.get_model(model_label).objects
+        .select_related('user')
+        .filter(pk=pk)
+        .first()
+    )
+
+    # The code may be deleted before the task is executed
+    if action_code is not None:
+        action_code.send_email()
+
+
+@shared_task(queue=settings.USER_EMAILS_TASK_QUEUE, ignore_result=True)
+def send_welcome_email(user_id: int) -> None:
+    """Send welcome email to the user with the given primary key."""
+    user = (
+        get_user_model().objects
+        .filter(pk=user_id)
+        .only('id', 'email')
+        .first()
+    )
+
+    if user is not None:
+        settings.USER_EMAILS_WELCOME.send_email(target=user.email, context={})
+
+
+def send_action_code_email_on_commit(
+    model_label: str,
+    pk: str,
+    action_code=None,
+) -> None:
+    """Send action code email after the current transaction is committed.
+
+    Uses the Celery task if the `USER_EMAILS_USE_CELERY` setting is enabled,
+    otherwise sends the email synchronously through the given `action_code`
+    instance (loaded by `pk` if it is not provided).
+    """
+    if settings.USER_EMAILS_USE_CELERY:
+        transaction.on_commit(
+            lambda: send_action_code_email.delay(model_label, pk),
+        )
+    elif action_code is not None:
+        transaction.on_commit(action_code.send_email)
+    else:
+        transaction.on_commit(lambda: send_action_code_email(model_label, pk))
+
+
+def send_welcome_email_on_commit(user) -> None:
+    """Send welcome email after the current transaction is committed."""
+    if settings.USER_EMAILS_USE_CELERY:
+        transaction.on_commit(lambda: send_welcome_email.delay(user.pk))
+    else:
+        transaction.on_commit(
+            lambda: settings.USER_EMAILS_WELCOME.send_email(
+                target=user.email,
+                context={},
+            ),
+        )
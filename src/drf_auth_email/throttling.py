@@ -0,0 +1,27 @@
+from rest_framework.settings import api_settings
+from rest_framework.throttling import \
+    ScopedRateThrottle as BaseScopedRateThrottle
+
+from .settings import settings
+
+
+class ScopedRateThrottle(BaseScopedRateThrottle):
+    """Scoped rate throttle with the `USER_THROTTLE_RATES` default rates.
+
+    The scope is taken from the view `user_throttle_scope` attribute, so the
+    DRF `ScopedRateThrottle` inside the `DEFAULT_THROTTLE_CLASSES` setting
+    does not require rates for the package scopes.
+
+    The rate specified inside the `DEFAULT_THROTTLE_RATES` DRF setting takes
+    precedence, the `None` rate disables throttling for the scope.
+    """
+
+    scope_attr = 'user_throttle_scope'
+
+    def get_rate(self):
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+
+        if self.scope in rates:
+            return rates[self.scope]
+
+        return settings.USER_THROTTLE_RATES.get(self.scope)
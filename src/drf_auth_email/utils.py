@@ -1,3 +1,5 @@
+import ipaddress
+
 from typing import Optional
 
 from django.core.mail import EmailMultiAlternatives
@@ -7,6 +9,30 @@ from django.conf import settings
 from .typing import TemplateFiles, Context
 
 
+def get_client_ip(request) -> str:
+    """Get client IP address from the first `X-Forwarded-For` entry.
+
+    Falls back to the `REMOTE_ADDR` header and to `0.0.0.0` when the
+    addresses are missing or invalid.
+    """
+    forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    candidates = (
+        forwarded_for.split(',', 1)[0].strip(),
+        request.META.get('REMOTE_ADDR', ''),
+    )
+
+    for candidate in candidates:
+        if not candidate:
+            continue
+
+        try:
+            return str(ipaddress.ip_address(candidate))
+        except ValueError:
+            continue
+
+    return '0.0.0.0'
+
+
 def get_template_files(folder: str, prefix: str) -> TemplateFiles:
     """Get mail templates file paths by folder and prefix."""
     return TemplateFiles(
@@ -1,26 +1,49 @@
 from typing import Type
-from ipware import get_client_ip
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
+from django.contrib.auth.hashers import make_password
 
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.authtoken.models import Token
 
-from . import serializers, models, schemas
+from . import serializers, models, schemas, tasks
 from .abstracts import AbstractCodeVerify
-from .settings import settings
+from .messages import \
+    ERR_PASSWORD_MISMATCH, \
+    ERR_EMAIL_TAKEN, \
+    ERR_PASSWORD_RESET_NOT_ALLOWED, \
+    ERR_LOGIN_INVALID, \
+    ERR_NOT_VERIFIED, \
+    ERR_NOT_ACTIVE, \
+    SUCCESS_CODE_VALID, \
+    SUCCESS_PASSWORD_RESET_SENT, \
+    SUCCESS_EMAIL_CHANGE_SENT, \
+    SUCCESS_PASSWORD_CHANGED, \
+    SUCCESS_LOGGED_OUT, \
+    SUCCESS_SIGNUP_VERIFIED, \
+    SUCCESS_PASSWORD_RESET, \
+    SUCCESS_EMAIL_CHANGED
+from .throttling import ScopedRateThrottle
 from .typing import Kwargs
-from .compat import \
-    extend_schema_view, extend_schema, OpenApiResponse, OpenApiExample
+from .utils import get_client_ip
+from .compat import extend_schema_view, extend_schema
 
 
 USER = get_user_model()
 Code = Type[AbstractCodeVerify]
 
+# Keep the project default throttles along with the scoped one
+THROTTLE_CLASSES = (
+    *api_settings.DEFAULT_THROTTLE_CLASSES,
+    ScopedRateThrottle,
+)
+
 
 class ActionCodeVerifyView(GenericAPIView):
     permission_classes = (AllowAny,)
@@ -28,25 +51,16 @@ class ActionCodeVerifyView(GenericAPIView):
     proceed_action = _('make action')
 
     def get_action_code_model(self):
-        # TODO: add assert
+        assert self.action_code_model, (
+            'The %s class `action_code_model` attribute was not provided.'
+            % self.__class__.__name__
+        )
         return self.action_code_model
 
     @extend_schema(
         parameters=[schemas.CodeQueryParameter],
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                description='Action code is valid',
-                examples=[
-                    OpenApiExample(
-                        'Code parameter is valid',
-                        description='code parameter is valid',
-                        value={
-                            'success': 'The given `code` parameter is valid.',
-                        },
-                    ),
-                ],
-            ),
+            200: schemas.CodeValidResponse,
             400: schemas.ErrorCodeResponse,
         },
     )
@@ -57,16 +71,18 @@ class ActionCodeVerifyView(GenericAPIView):
         valid before proceeding the requested action.
         """
         try:
-            self.get_action_code_model().check_is_valid(request.GET.get('code'))
+            action_code_model = self.get_action_code_model()
+            action_code_model.check_is_valid(
+                request.GET.get('code'),
+                fields=action_code_model.check_fields,
+            )
         except ValueError as err:
             return Response({
                 'detail': str(err),
             }, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({
-            'success': _(
-                'The given `code` parameter is valid, can proceed to %s.'
-            ) % self.proceed_action,
+            'success': SUCCESS_CODE_VALID % self.proceed_action,
         })
 
 
@@ -76,11 +92,17 @@ class ActionVerifyView(GenericAPIView):
     success_message: str = None
 
     def get_action_code_model(self):
-        # TODO: add assert
+        assert self.action_code_model, (
+            'The %s class `action_code_model` attribute was not provided.'
+            % self.__class__.__name__
+        )
         return self.action_code_model
 
     def get_success_message(self):
-        # TODO: ad assert
+        assert self.success_message, (
+            'The %s class `success_message` attribute was not provided.'
+            % self.__class__.__name__
+        )
         return self.success_message
 
     def handle_action_code(self, action_code: Code, **kwargs) -> None:
@@ -91,6 +113,13 @@ class ActionVerifyView(GenericAPIView):
         # May be overridden
         return {}
 
+    def delete_user_action_codes(self, action_code: Code) -> None:
+        # Action codes have no reverse relations, so Django performs the
+        # "fast delete" with a single DELETE query without collecting rows
+        self.get_action_code_model().objects.filter(
+            user_id=action_code.user_id,
+        ).delete()
+
     @extend_schema(
         parameters=[schemas.CodeQueryParameter],
         responses={
@@ -108,18 +137,23 @@ class ActionVerifyView(GenericAPIView):
                 'detail': str(err),
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        kwargs = self.handle_request(request, action_code)
+        # Emails must be scheduled with `transaction.on_commit()` inside
+        # the handlers to be sent only after the changes are committed
+        with transaction.atomic():
+            kwargs = self.handle_request(request, action_code)
 
-        if isinstance(kwargs, Response):
-            return kwargs
+            if isinstance(kwargs, Response):
+                return kwargs
 
-        self.handle_action_code(action_code, **kwargs)
+            self.handle_action_code(action_code, **kwargs)
 
-        return Response({'success': self.success_message})
+        return Response({'success': self.get_success_message()})
 
 
 class Signup(GenericAPIView):
     permission_classes = (AllowAny,)
+    throttle_classes = THROTTLE_CLASSES
+    user_throttle_scope = 'signup'
     signup_serializer_class = serializers.SignupSerializer
     user_serializer_class = serializers.UserSerializer
     signup_model = models.SignupCode
@@ -127,14 +161,47 @@ class Signup(GenericAPIView):
     def get_serializer_class(self):
         return self.signup_serializer_class
 
-    def check_verified_users(self, serializer) -> USER:
-        # Check verified user with the given email existence
-        user, is_created = USER.objects.get_or_create(
-            email=serializer.data.get('email'),
+    def get_user_fields(self) -> set[str]:
+        # Fields of the unverified user which are updated on each signup
+        return (
+            set(self.user_serializer_class.Meta.fields)
+            - {'id', 'email', 'password', 'link'}
         )
 
-        if not is_created and user.is_verified:
-            raise ValueError(_('Email address already taken.'))
+    def get_user_defaults(self, serializer) -> Kwargs:
+        validated_data = serializer.validated_data
+        defaults = {
+            'password': make_password(validated_data.get('password')),
+        }
+
+        for field in self.get_user_fields():
+            if field in validated_data:
+                defaults[field] = validated_data.get(field)
+
+        return defaults
+
+    def update_unverified_user(self, serializer) -> USER:
+        email = serializer.validated_data.get('email')
+        defaults = self.get_user_defaults(serializer)
+        user = USER.objects.filter(email=email).first()
+
+        if user is None:
+            # The user with the same email may be created in the meantime
+            try:
+                with transaction.atomic():
+                    return USER.objects.create(email=email, **defaults)
+            except IntegrityError:
+                raise ValueError(ERR_EMAIL_TAKEN)
+
+        # Update the user only while it is unverified, so the user verified
+        # in the meantime is not overwritten
+        if user.is_verified or not USER.objects.filter(
+            pk=user.pk, is_verified=False,
+        ).update(**defaults):
+            raise ValueError(ERR_EMAIL_TAKEN)
+
+        for field, value in defaults.items():
+            setattr(user, field, value)
 
         return user
 
@@ -142,14 +209,8 @@ class Signup(GenericAPIView):
         summary='create signup request',
         request=signup_serializer_class,
         responses={
-            201: OpenApiResponse(
-                response=user_serializer_class,
-                description='New unverified user',
-            ),
-            400: OpenApiResponse(
-                response=serializers.DetailErrorSerializer,
-                description='The request body is invalid',
-            )
+            201: schemas.SignupResponse,
+            400: schemas.SignupErrorResponse,
         },
     )
     def post(self, request, format=None):
@@ -170,35 +231,29 @@ class Signup(GenericAPIView):
             )
 
         try:
-            user = self.check_verified_users(signup_serializer)
+            user = self.update_unverified_user(signup_serializer)
         except ValueError as err:
             return Response({
                 'detail': str(err),
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # handle unverified user with the given data
-        user_serializer = self.user_serializer_class(
-            user, data=signup_serializer.data, partial=True,
-        )
-
-        if not user_serializer.is_valid():
-            return Response(
-                user_serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        user = user_serializer.save()
-
         # Handle signup code
         signup_code = self.signup_model.objects.create(
             user=user,
-            ipaddr=get_client_ip(request)[0] or '0.0.0.0',
-            link=signup_serializer.data.get('link') or '',
+            ipaddr=get_client_ip(request),
+            link=signup_serializer.validated_data.get('link') or '',
+        )
+        tasks.send_action_code_email_on_commit(
+            signup_code._meta.label,
+            signup_code.pk,
+            action_code=signup_code,
         )
-        signup_code.send_email()
 
         # Return update user instance serializer
-        return Response(user_serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            self.user_serializer_class(user).data,
+            status=status.HTTP_201_CREATED,
+        )
 
 
 @extend_schema_view(get=extend_schema(summary='verify signup code'))
@@ -209,41 +264,29 @@ class SignupCodeVerify(ActionCodeVerifyView):
 
 class SignupVerify(ActionVerifyView):
     action_code_model = models.SignupCode
-    success_message = _('User email address has been verified.')
+    success_message = SUCCESS_SIGNUP_VERIFIED
 
     def send_welcome_email(self, **kwargs):
         action_code = kwargs.get('action_code')
 
-        # Send welcome email
-        settings.USER_EMAILS_WELCOME.send_email(
-            target=action_code.user.email,
-            context={},
-        )
+        # Send welcome email after the user verification is committed
+        tasks.send_welcome_email_on_commit(action_code.user)
 
     def handle_action_code(self, action_code: Code, **kwargs) -> None:
         # Verify user
         action_code.verify_user()
 
-        self.send_welcome_email(action_code=action_code)
-
         # Delete all related to verified user signup codes
-        self.action_code_model.objects.filter(user=action_code.user).delete()
+        self.delete_user_action_codes(action_code)
+
+        self.send_welcome_email(action_code=action_code)
 
     @extend_schema(
         summary='complete user signup',
         request=None,
         parameters=[schemas.CodeQueryParameter],
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                description='',
-                examples=[
-                    OpenApiExample(
-                        'Signup completed successfully',
-                        value={'success': success_message},
-                    ),
-                ],
-            ),
+            200: schemas.SignupVerifiedResponse,
             400: schemas.ErrorCodeResponse,
         },
     )
@@ -261,31 +304,47 @@ class SignupVerify(ActionVerifyView):
 
 class PasswordReset(GenericAPIView):
     permission_classes = (AllowAny,)
+    throttle_classes = THROTTLE_CLASSES
+    user_throttle_scope = 'password_reset'
     serializer_class = serializers.PasswordResetSerializer
     password_reset_model = models.PasswordResetCode
 
+    def create_password_reset_code(
+        self,
+        email: str,
+        ipaddr: str,
+        link: str,
+    ) -> str | None:
+        # Create the code only for the verified and active user with the
+        # provided email, using a single query if the model supports it
+        create_for_verified_email = getattr(
+            self.password_reset_model, 'create_for_verified_email', None,
+        )
+
+        if create_for_verified_email is not None:
+            return create_for_verified_email(
+                email=email, ipaddr=ipaddr, link=link,
+            )
+
+        user = (
+            USER.objects
+            .filter(email=email, is_verified=True, is_active=True)
+            .only('id')
+            .first()
+        )
+
+        if user is None:
+            return None
+
+        return self.password_reset_model.objects.create(
+            user=user, ipaddr=ipaddr, link=link,
+        ).pk
+
     @extend_schema(
         summary='create password reset request',
         request=serializer_class,
         responses={
-            201: OpenApiResponse(
-                response=serializers.SuccessMessageWithEmailSerializer,
-                description='The password reset request has been created',
-                examples=[
-                    OpenApiExample(
-                        'Success password reset request creation',
-                        value={
-                            'success': 'Success message',
-                            'email': 'example@email.com',
-                        },
-                        description=(
-                            'A password reset message has been sent to '
-                            '`example@email.com`. The user can continue '
-                            'the action by clicking the sent link.'
-                        ),
-                    ),
-                ],
-            ),
+            201: schemas.PasswordResetCreatedResponse,
             400: schemas.DetailErrorSerializer,
         },
     )
@@ -302,28 +361,26 @@ class PasswordReset(GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Save way to get user with the provided email
-        user = USER.objects.filter(email=serializer.data.get('email')).first()
+        email = serializer.validated_data.get('email')
+        code = self.create_password_reset_code(
+            email=email,
+            ipaddr=get_client_ip(request),
+            link=serializer.validated_data.get('link') or '',
+        )
 
-        if user and user.is_verified and user.is_active:
-            password_reset_code = self.password_reset_model.objects.create(
-                user=user,
-                ipaddr=get_client_ip(request)[0] or '0.0.0.0',
-                link=serializer.data.get('link') or '',
+        if code is not None:
+            tasks.send_action_code_email_on_commit(
+                self.password_reset_model._meta.label, code,
             )
 
-            password_reset_code.send_email()
-
             return Response({
-                'success': _(
-                    'The email with the password reset code will be sent soon.',
-                ),
-                'email': user.email,
+                'success': SUCCESS_PASSWORD_RESET_SENT,
+                'email': email,
             }, status=status.HTTP_201_CREATED)
 
         # Since this is AllowAny, don't give away error.
         return Response({
-            'detail': _('Password reset not allowed.'),
+            'detail': ERR_PASSWORD_RESET_NOT_ALLOWED,
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -336,7 +393,7 @@ class PasswordResetCodeVerify(ActionCodeVerifyView):
 class PasswordResetVerify(ActionVerifyView):
     serializer_class = serializers.PasswordResetVerifiedSerializer
     action_code_model = models.PasswordResetCode
-    success_message = _('User password has been reset.')
+    success_message = SUCCESS_PASSWORD_RESET
 
     def handle_request(self, request, action_code: Code) -> Kwargs | Response:
         serializer = self.serializer_class(data=request.data)
@@ -355,27 +412,19 @@ class PasswordResetVerify(ActionVerifyView):
         serializer = kwargs.get('serializer')
 
         # Set new user password
-        action_code.change_user_password(serializer.data.get('password'))
+        action_code.change_user_password(
+            serializer.validated_data.get('password'),
+        )
 
         # Delete all related password reset instances
-        self.action_code_model.objects.filter(
-            user=action_code.user,
-        ).delete()
+        self.delete_user_action_codes(action_code)
 
     @extend_schema(
         summary='complete password reset',
         request=serializer_class,
         parameters=[schemas.CodeQueryParameter],
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                examples=[
-                    OpenApiExample(
-                        'Password reset completed successfully',
-                        value={'success': success_message},
-                    ),
-                ],
-            ),
+            200: schemas.PasswordResetVerifiedResponse,
             400: schemas.ErrorCodeResponse,
         },
     )
@@ -394,6 +443,8 @@ class PasswordResetVerify(ActionVerifyView):
 
 class EmailChange(GenericAPIView):
     permission_classes = (IsAuthenticated,)
+    throttle_classes = THROTTLE_CLASSES
+    user_throttle_scope = 'email_change'
     serializer_class = serializers.EmailChangeSerializer
     email_change_model = models.EmailChangeCode
 
@@ -401,24 +452,7 @@ class EmailChange(GenericAPIView):
         summary='create email change request',
         request=serializer_class,
         responses={
-            201: OpenApiResponse(
-                response=serializers.SuccessMessageWithEmailSerializer,
-                description='The email change request has been created',
-                examples=[
-                    OpenApiExample(
-                        'Success email change request creation',
-                        value={
-                            'success': 'Success message',
-                            'email': 'example@email.com',
-                        },
-                        description=(
-                            'A email change message has been sent to '
-                            '`example@email.com`. The user can continue '
-                            'the action by clicking the sent link.'
-                        ),
-                    ),
-                ],
-            ),
+            201: schemas.EmailChangeCreatedResponse,
             400: schemas.DetailErrorSerializer,
         },
     )
@@ -435,26 +469,33 @@ class EmailChange(GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        new_email = serializer.data.get('email')
-        user_with_new_email = USER.objects.filter(email=new_email).first()
+        new_email = serializer.validated_data.get('email')
+        user_with_new_email = (
+            USER.objects
+            .filter(email=new_email)
+            .only('id', 'is_verified')
+            .first()
+        )
 
         if user_with_new_email and user_with_new_email.is_verified:
             return Response({
-                'detail': _('Email address already taken.'),
+                'detail': ERR_EMAIL_TAKEN,
             }, status=status.HTTP_400_BAD_REQUEST)
 
         email_change_code = self.email_change_model.objects.create(
             user=request.user,
             new_email=new_email,
-            ipaddr=get_client_ip(request)[0] or '0.0.0.0',
-            link=serializer.data.get('link') or '',
+            ipaddr=get_client_ip(request),
+            link=serializer.validated_data.get('link') or '',
+        )
+        tasks.send_action_code_email_on_commit(
+            email_change_code._meta.label,
+            email_change_code.pk,
+            action_code=email_change_code,
         )
-        email_change_code.send_email()
 
         return Response({
-            'success': _(
-                'The email with the email change code will be sent soon.',
-            ),
+            'success': SUCCESS_EMAIL_CHANGE_SENT,
             'email': new_email,
         }, status=status.HTTP_201_CREATED)
 
@@ -467,17 +508,20 @@ class EmailChangeCodeVerify(ActionCodeVerifyView):
 
 class EmailChangeVerify(ActionVerifyView):
     action_code_model = models.EmailChangeCode
-    success_message = _('Email address has been changed.')
+    success_message = SUCCESS_EMAIL_CHANGED
 
     def handle_request(self, request, action_code: Code) -> Kwargs | Response:
         user_with_new_email = (
-            USER.objects.filter(email=action_code.new_email).first()
+            USER.objects
+            .filter(email=action_code.new_email)
+            .only('id', 'is_verified')
+            .first()
         )
 
         if user_with_new_email:
             if user_with_new_email.is_verified:
                 return Response({
-                    'detail': _('Email address already taken.'),
+                    'detail': ERR_EMAIL_TAKEN,
                 }, status=status.HTTP_400_BAD_REQUEST)
 
             # If the account with this email address is not verified,
@@ -489,22 +533,14 @@ class EmailChangeVerify(ActionVerifyView):
 
     def handle_action_code(self, action_code: Code, **kwargs) -> None:
         action_code.change_user_email()
-        self.action_code_model.objects.filter(user=action_code.user).delete()
+        self.delete_user_action_codes(action_code)
 
     @extend_schema(
         summary='complete email change',
         request=None,
         parameters=[schemas.CodeQueryParameter],
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                examples=[
-                    OpenApiExample(
-                        'Email change completed successfully',
-                        value={'success': success_message},
-                    ),
-                ],
-            ),
+            200: schemas.EmailChangeVerifiedResponse,
             400: schemas.ErrorCodeResponse,
         },
     )
@@ -529,15 +565,7 @@ class PasswordChange(GenericAPIView):
         summary='change user password',
         request=serializer_class,
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                examples=[
-                    OpenApiExample(
-                        'Password change completed successfully',
-                        value={'success': 'Password has been changed.'},
-                    ),
-                ],
-            ),
+            200: schemas.PasswordChangedResponse,
             400: schemas.ErrorCodeResponse,
         }
     )
@@ -553,41 +581,38 @@ class PasswordChange(GenericAPIView):
 
         user = request.user
 
-        if not user.check_password(serializer.data.get('password')):
+        if not user.check_password(serializer.validated_data.get('password')):
             return Response({
-                'detail': _(
-                    'The given `password` field does not match with the '
-                    'user password.',
-                ),
+                'detail': ERR_PASSWORD_MISMATCH,
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        user.set_password(serializer.data.get('new_password'))
-        user.save()
+        user.set_password(serializer.validated_data.get('new_password'))
+        user.save(update_fields=['password'])
 
         return Response({
-            'success': _('Password has been changed.'),
+            'success': SUCCESS_PASSWORD_CHANGED,
         }, status=status.HTTP_200_OK)
 
 
 class Login(GenericAPIView):
     permission_classes = (AllowAny,)
+    throttle_classes = THROTTLE_CLASSES
+    user_throttle_scope = 'login'
     serializer_class = serializers.LoginSerializer
 
     def authenticate_user(
         self,
         serializer: serializers.LoginSerializer,
     ) -> USER:
-        email = serializer.data.get('email')
-        password = serializer.data.get('password')
-        return authenticate(email=email, password=password)
+        email = serializer.validated_data.get('email')
+        password = serializer.validated_data.get('password')
+
+        return authenticate(self.request, email=email, password=password)
 
     @extend_schema(
         summary='login',
         responses={
-            200: OpenApiResponse(
-                response=serializers.TokenSerializer,
-                description='User authentication token',
-            ),
+            200: schemas.TokenResponse,
             401: serializers.DetailErrorSerializer,
         }
     )
@@ -609,20 +634,25 @@ class Login(GenericAPIView):
 
         if not user:
             return Response({
-                'detail': _('Unable to login with provided credentials.'),
+                'detail': ERR_LOGIN_INVALID,
             }, status=status.HTTP_401_UNAUTHORIZED)
 
         if not user.is_verified:
             return Response({
-                'detail': _('User account not verified.'),
+                'detail': ERR_NOT_VERIFIED,
             }, status=status.HTTP_401_UNAUTHORIZED)
 
         if not user.is_active:
             return Response({
-                'detail': _('User account not active.'),
+                'detail': ERR_NOT_ACTIVE,
             }, status=status.HTTP_401_UNAUTHORIZED)
 
-        token, is_created = Token.objects.get_or_create(user=user)
+        # The token is usually joined to the user by the backend lookup
+        try:
+            token = user.auth_token
+        except Token.DoesNotExist:
+            token, is_created = Token.objects.get_or_create(user=user)
+
         return Response({'token': token.key}, status=status.HTTP_200_OK)
 
 
@@ -634,17 +664,7 @@ class Logout(GenericAPIView):
         request=None,
         parameters=[schemas.AuthorizationHeaderParameter],
         responses={
-            200: OpenApiResponse(
-                response=serializers.SuccessMessageSerializer,
-                examples=[
-                    OpenApiExample(
-                        'Message about user logging out',
-                        value={
-                            'success': 'User logged out',
-                        },
-                    ),
-                ],
-            ),
+            200: schemas.LoggedOutResponse,
         },
     )
     def post(self, request, format=None):
@@ -653,9 +673,7 @@ class Logout(GenericAPIView):
         Note:
             Deletes the user related authentication token.
         """
-        tokens = Token.objects.filter(user=request.user)
-        for token in tokens:
-            token.delete()
+        Token.objects.filter(user=request.user).delete()
         return Response({
-            'success': _('User logged out.'),
+            'success': SUCCESS_LOGGED_OUT,
         }, status=status.HTTP_200_OK)
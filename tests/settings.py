@@ -0,0 +1,40 @@
+SECRET_KEY = 'drf-auth-email-tests'
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'rest_framework',
+    'rest_framework.authtoken',
+    'drf_auth_email',
+
+    'tests.testapp',
+]
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
+
+AUTH_USER_MODEL = 'testapp.User'
+
+USE_TZ = True
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+EMAIL_FROM = 'noreply@example.com'
+EMAIL_BCC = 'bcc@example.com'
+
+ROOT_URLCONF = 'drf_auth_email.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'APP_DIRS': True,
+    },
+]
+
+# Throttling is tested with explicit rates
+USER_THROTTLE_RATES = {}
@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from drf_auth_email.models import PasswordResetCode
+
+
+USER = get_user_model()
+
+
+class PasswordResetCodeCreateForVerifiedEmailTests(TestCase):
+    def create_user(self, email, **extra_fields):
+        extra_fields.setdefault('is_verified', True)
+        extra_fields.setdefault('is_active', True)
+        return USER.objects.create_user(email, 'password', **extra_fields)
+
+    def create_code(self, email):
+        return PasswordResetCode.create_for_verified_email(
+            email=email,
+            ipaddr='127.0.0.1',
+            link='http://example.com/reset/',
+        )
+
+    def test_verified_active_user(self):
+        user = self.create_user('user@example.com')
+
+        code = self.create_code('user@example.com')
+
+        instance = PasswordResetCode.objects.get(pk=code)
+        self.assertEqual(instance.user, user)
+        self.assertEqual(instance.ipaddr, '127.0.0.1')
+        self.assertEqual(instance.link, 'http://example.com/reset/')
+        self.assertFalse(instance.is_expired())
+
+    def test_unverified_user(self):
+        self.create_user('user@example.com', is_verified=False)
+
+        self.assertIsNone(self.create_code('user@example.com'))
+        self.assertFalse(PasswordResetCode.objects.exists())
+
+    def test_inactive_user(self):
+        self.create_user('user@example.com', is_active=False)
+
+        self.assertIsNone(self.create_code('user@example.com'))
+        self.assertFalse(PasswordResetCode.objects.exists())
+
+    def test_missing_user(self):
+        self.create_user('other@example.com')
+
+        self.assertIsNone(self.create_code('user@example.com'))
+        self.assertFalse(PasswordResetCode.objects.exists())
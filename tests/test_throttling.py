@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import throttling
+
+from drf_auth_email import views
+
+
+class ScopedRateThrottleTests(TestCase):
+    url = reverse('drf-auth-email-login')
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self, times):
+        return [
+            self.client.post(self.url, {
+                'email': 'user@example.com',
+                'password': 'password',
+            }).status_code
+            for _ in range(times)
+        ]
+
+    @override_settings(USER_THROTTLE_RATES={'login': '2/minute'})
+    def test_default_rate(self):
+        self.assertEqual(self.login(3), [401, 401, 429])
+
+    @override_settings(
+        USER_THROTTLE_RATES={'login': '2/minute'},
+        REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {'login': '1/minute'}},
+    )
+    def test_project_rate_takes_precedence(self):
+        self.assertEqual(self.login(2), [401, 429])
+
+    @override_settings(
+        USER_THROTTLE_RATES={'login': '1/minute'},
+        REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {'login': None}},
+    )
+    def test_project_none_rate_disables_scope(self):
+        self.assertEqual(self.login(3), [401, 401, 401])
+
+    @override_settings(USER_THROTTLE_RATES={'login': None})
+    def test_none_rate_disables_scope(self):
+        self.assertEqual(self.login(3), [401, 401, 401])
+
+    @override_settings(
+        USER_THROTTLE_RATES={'login': '2/minute'},
+        REST_FRAMEWORK={
+            'DEFAULT_THROTTLE_CLASSES': [
+                'rest_framework.throttling.ScopedRateThrottle',
+            ],
+            'DEFAULT_THROTTLE_RATES': {'other': '1/minute'},
+        },
+    )
+    def test_project_scoped_rate_throttle(self):
+        # The project DRF scoped throttle must ignore the package scopes
+        throttle_classes = (
+            throttling.ScopedRateThrottle,
+            views.ScopedRateThrottle,
+        )
+
+        with mock.patch.object(
+            views.Login, 'throttle_classes', throttle_classes,
+        ):
+            self.assertEqual(self.login(3), [401, 401, 429])
@@ -0,0 +1,55 @@
+from django.test import RequestFactory, SimpleTestCase
+
+from drf_auth_email.utils import get_client_ip
+
+
+class GetClientIpTests(SimpleTestCase):
+    def get_client_ip(self, **meta):
+        request = RequestFactory().get('/', **meta)
+        return get_client_ip(request)
+
+    def test_remote_addr(self):
+        self.assertEqual(
+            self.get_client_ip(REMOTE_ADDR='10.0.0.1'),
+            '10.0.0.1',
+        )
+
+    def test_forwarded_for_first_entry(self):
+        self.assertEqual(
+            self.get_client_ip(
+                HTTP_X_FORWARDED_FOR=' 203.0.113.5 , 10.0.0.2,10.0.0.3',
+                REMOTE_ADDR='10.0.0.1',
+            ),
+            '203.0.113.5',
+        )
+
+    def test_invalid_forwarded_for_falls_back_to_remote_addr(self):
+        self.assertEqual(
+            self.get_client_ip(
+                HTTP_X_FORWARDED_FOR='unknown, 203.0.113.5',
+                REMOTE_ADDR='10.0.0.1',
+            ),
+            '10.0.0.1',
+        )
+
+    def test_invalid_remote_addr(self):
+        self.assertEqual(
+            self.get_client_ip(REMOTE_ADDR='invalid'),
+            '0.0.0.0',
+        )
+
+    def test_missing_addresses(self):
+        self.assertEqual(self.get_client_ip(REMOTE_ADDR=''), '0.0.0.0')
+
+    def test_ipv6(self):
+        self.assertEqual(
+            self.get_client_ip(
+                HTTP_X_FORWARDED_FOR='2001:DB8::1, 10.0.0.2',
+                REMOTE_ADDR='10.0.0.1',
+            ),
+            '2001:db8::1',
+        )
+        self.assertEqual(
+            self.get_client_ip(REMOTE_ADDR='::1'),
+            '::1',
+        )
@@ -0,0 +1,143 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.core import mail
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import serializers as drf_serializers
+from rest_framework.test import APIRequestFactory
+
+from drf_auth_email import serializers, views
+from drf_auth_email.models import SignupCode
+
+
+USER = get_user_model()
+
+
+class SignupTests(TestCase):
+    url = reverse('drf-auth-email-signup')
+
+    def signup(self, **data):
+        data.setdefault('email', 'user@example.com')
+        data.setdefault('password', 'new-password')
+        return self.client.post(self.url, data)
+
+    def test_creates_unverified_user(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.signup(first_name='First')
+
+        self.assertEqual(response.status_code, 201)
+
+        user = USER.objects.get(email='user@example.com')
+        self.assertFalse(user.is_verified)
+        self.assertEqual(user.first_name, 'First')
+        self.assertTrue(user.check_password('new-password'))
+        self.assertTrue(SignupCode.objects.filter(user=user).exists())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_updates_unverified_user(self):
+        user = USER.objects.create_user('user@example.com', 'old-password')
+
+        response = self.signup()
+
+        self.assertEqual(response.status_code, 201)
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('new-password'))
+
+    def test_verified_user_is_not_overwritten(self):
+        user = USER.objects.create_user(
+            'user@example.com', 'old-password', is_verified=True,
+        )
+
+        response = self.signup()
+
+        self.assertEqual(response.status_code, 400)
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('old-password'))
+        self.assertFalse(SignupCode.objects.exists())
+
+    def test_updates_unverified_user_queries(self):
+        USER.objects.create_user('user@example.com', 'old-password')
+
+        # User SELECT, conditional user UPDATE and signup code INSERT
+        with self.assertNumQueries(3):
+            response = self.signup()
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_user_verified_after_check_is_not_overwritten(self):
+        user = USER.objects.create_user('user@example.com', 'old-password')
+        stale_user = USER.objects.get(pk=user.pk)
+        USER.objects.filter(pk=user.pk).update(is_verified=True)
+
+        # Emulate the user verification between the user lookup and the
+        # unverified user update
+        with mock.patch.object(QuerySet, 'first', return_value=stale_user):
+            response = self.signup()
+
+        self.assertEqual(response.status_code, 400)
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('old-password'))
+        self.assertFalse(SignupCode.objects.exists())
+
+    def test_user_created_after_check_is_not_overwritten(self):
+        user = USER.objects.create_user(
+            'user@example.com', 'old-password', is_verified=True,
+        )
+
+        # Emulate the user creation between the user lookup and the user
+        # creation
+        with mock.patch.object(QuerySet, 'first', return_value=None):
+            response = self.signup()
+
+        self.assertEqual(response.status_code, 400)
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('old-password'))
+
+
+class PhoneSignupSerializer(serializers.SignupSerializer):
+    phone = drf_serializers.CharField(max_length=20, required=False)
+
+
+class PhoneUserSerializer(serializers.UserSerializer):
+    class Meta(serializers.UserSerializer.Meta):
+        fields = serializers.UserSerializer.Meta.fields + ('phone',)
+
+
+class PhoneSignup(views.Signup):
+    signup_serializer_class = PhoneSignupSerializer
+    user_serializer_class = PhoneUserSerializer
+
+
+class CustomSignupSerializerTests(TestCase):
+    def signup(self, **data):
+        request = APIRequestFactory().post('/signup/', data)
+        return PhoneSignup.as_view()(request)
+
+    def test_creates_user_with_custom_field(self):
+        response = self.signup(
+            email='user@example.com',
+            password='password',
+            phone='123',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['phone'], '123')
+        self.assertEqual(USER.objects.get().phone, '123')
+
+    def test_updates_unverified_user_custom_field(self):
+        USER.objects.create_user('user@example.com', 'password', phone='1')
+
+        response = self.signup(
+            email='user@example.com',
+            password='password',
+            phone='123',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(USER.objects.get().phone, '123')
@@ -0,0 +1,12 @@
+from django.db import models
+
+from drf_auth_email.abstracts import AbstractUser
+
+
+class User(AbstractUser):
+    # Used to test custom signup fields
+    phone = models.CharField(max_length=20, blank=True, default='')
+
+    class Meta(AbstractUser.Meta):
+        swappable = 'AUTH_USER_MODEL'
+        abstract = False